@@ -28,31 +28,47 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
+
 import RNS.Cryptography.Provider as cp
 import RNS.vendor.platformutils as pu
 
 if cp.PROVIDER == cp.PROVIDER_INTERNAL:
     from .aes import AES128
     from .aes import AES256
-    
+
+    # Key expansion is by far the most expensive part of the pure-Python
+    # AES implementation, and the same key is reused for every packet on
+    # a link, so cipher instances are cached per key.
+    @functools.lru_cache(maxsize=256)
+    def _cipher_for_key(key):
+        if len(key) == 16: return AES128(key)
+        else: return AES256(key)
+
 elif cp.PROVIDER == cp.PROVIDER_PYCA:
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
     if pu.cryptography_old_api(): from cryptography.hazmat.backends import default_backend
 
+    # Reuse the keyed algorithm object between packets, so that only the
+    # per-IV cipher context is constructed per call.
+    @functools.lru_cache(maxsize=256)
+    def _algorithm_for_key(key):
+        return algorithms.AES(key)
+
 
 class AES_128_CBC:
     @staticmethod
     def encrypt(plaintext, key, iv):
         if len(key) != 16: raise ValueError(f"Invalid key length {len(key)*8} for {self}")
         if cp.PROVIDER == cp.PROVIDER_INTERNAL:
-            cipher = AES128(key)
+            cipher = _cipher_for_key(key)
             return cipher.encrypt(plaintext, iv)
 
         elif cp.PROVIDER == cp.PROVIDER_PYCA:
             if not pu.cryptography_old_api():
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv))
             else:
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv), backend=default_backend())
 
             encryptor = cipher.encryptor()
             ciphertext = encryptor.update(plaintext) + encryptor.finalize()
@@ -62,14 +78,14 @@ class AES_128_CBC:
     def decrypt(ciphertext, key, iv):
         if len(key) != 16: raise ValueError(f"Invalid key length {len(key)*8} for {self}")
         if cp.PROVIDER == cp.PROVIDER_INTERNAL:
-            cipher = AES128(key)
+            cipher = _cipher_for_key(key)
             return cipher.decrypt(ciphertext, iv)
 
         elif cp.PROVIDER == cp.PROVIDER_PYCA:
             if not pu.cryptography_old_api():
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv))
             else:
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv), backend=default_backend())
 
             decryptor = cipher.decryptor()
             plaintext = decryptor.update(ciphertext) + decryptor.finalize()
@@ -80,14 +96,14 @@ class AES_256_CBC:
     def encrypt(plaintext, key, iv):
         if len(key) != 32: raise ValueError(f"Invalid key length {len(key)*8} for {self}")
         if cp.PROVIDER == cp.PROVIDER_INTERNAL:
-            cipher = AES256(key)
+            cipher = _cipher_for_key(key)
             return cipher.encrypt_cbc(plaintext, iv)
 
         elif cp.PROVIDER == cp.PROVIDER_PYCA:
             if not pu.cryptography_old_api():
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv))
             else:
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv), backend=default_backend())
             
             encryptor = cipher.encryptor()
             ciphertext = encryptor.update(plaintext) + encryptor.finalize()
@@ -97,14 +113,14 @@ class AES_256_CBC:
     def decrypt(ciphertext, key, iv):
         if len(key) != 32: raise ValueError(f"Invalid key length {len(key)*8} for {self}")
         if cp.PROVIDER == cp.PROVIDER_INTERNAL:
-            cipher = AES256(key)
+            cipher = _cipher_for_key(key)
             return cipher.decrypt_cbc(ciphertext, iv)
 
         elif cp.PROVIDER == cp.PROVIDER_PYCA:
             if not pu.cryptography_old_api():
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv))
             else:
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+                cipher = Cipher(_algorithm_for_key(key), modes.CBC(iv), backend=default_backend())
 
             decryptor = cipher.decryptor()
             plaintext = decryptor.update(ciphertext) + decryptor.finalize()
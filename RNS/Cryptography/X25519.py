@@ -14,6 +14,16 @@
 import os
 import time
 
+# If libsodium is available via PyNaCl, use its constant-time
+# crypto_scalarmult implementation instead of the pure-Python
+# Montgomery ladder below.
+try:
+    from nacl.bindings import crypto_scalarmult as _crypto_scalarmult
+    from nacl.bindings import crypto_scalarmult_base as _crypto_scalarmult_base
+except ImportError:
+    _crypto_scalarmult = None
+    _crypto_scalarmult_base = None
+
 P = 2 ** 255 - 19
 _A = 486662
 
@@ -134,12 +144,21 @@ class X25519PrivateKey:
         return _pack_number(self.a)
 
     def public_key(self):
+        if _crypto_scalarmult_base != None:
+            return X25519PublicKey.from_public_bytes(_crypto_scalarmult_base(_pack_number(self.a)))
+
         return X25519PublicKey.from_public_bytes(_pack_number(_raw_curve25519(9, self.a)))
 
     def exchange(self, peer_public_key):
         if isinstance(peer_public_key, bytes):
             peer_public_key = X25519PublicKey.from_public_bytes(peer_public_key)
 
+        # The libsodium scalar multiplication is constant-time, so the
+        # execution time masking applied to the pure-Python ladder below
+        # is not needed on this path.
+        if _crypto_scalarmult != None:
+            return _crypto_scalarmult(_pack_number(self.a), _pack_number(peer_public_key.x))
+
         start = time.time()
         
         shared = _pack_number(_raw_curve25519(peer_public_key.x, self.a))
@@ -31,6 +31,7 @@
 import os
 import math
 import time
+import inspect
 import threading
 import RNS
 
@@ -169,7 +170,7 @@ class Destination:
         self.mtu = 0
 
         self.path_responses = {}
-        self.links = []
+        self.links = {}
 
         if identity == None and direction == Destination.IN and self.type != Destination.PLAIN:
             identity = RNS.Identity()
@@ -392,8 +393,11 @@ class Destination:
         elif not callable(response_generator): raise ValueError("Invalid response generator specified")
         elif not allow in Destination.request_policies: raise ValueError("Invalid request policy")
         else:
+            arity = len(inspect.signature(response_generator).parameters)
+            if arity != 5 and arity != 6: raise ValueError("Invalid signature for response generator specified")
+            if allowed_list != None: allowed_list = frozenset(allowed_list)
             path_hash = RNS.Identity.truncated_hash(path.encode("utf-8"))
-            request_handler = [path, response_generator, allow, allowed_list, auto_compress]
+            request_handler = [path, response_generator, allow, allowed_list, auto_compress, arity]
             self.request_handlers[path_hash] = request_handler
 
     def deregister_request_handler(self, path):
@@ -432,7 +436,7 @@ class Destination:
         if self.accept_link_requests:
             link = RNS.Link.validate_request(self, data, packet)
             if link != None:
-                self.links.append(link)
+                self.links[link.link_id] = link
 
     def _reload_ratchets(self, ratchets_path):
         if os.path.isfile(ratchets_path):
@@ -34,16 +34,183 @@ from RNS.Channel import Channel, LinkChannelOutlet
 from RNS import Reticulum
 
 from time import sleep
-from .vendor import umsgpack as umsgpack
+from RNS._msgpack import packb as _packb, unpackb as _unpackb
+import concurrent.futures
+import functools
 import threading
-import inspect
 import struct
+import heapq
+import queue
 import math
 import time
 import RNS
 import io
+import os
+
+_SIGLENGTH_BYTES = RNS.Identity.SIGLENGTH//8
+_ID_KEY_B        = RNS.Identity.KEYSIZE//8
+_ID_SIG_B        = RNS.Identity.SIGLENGTH//8
+_ID_PUBSIG_LEN   = _ID_KEY_B+_ID_SIG_B
+_ID_HASH_B       = RNS.Identity.HASHLENGTH//8
+_ECPUBSIZE       = 32+32
+_ECPUB_HALF      = _ECPUBSIZE//2
+_LINK_MTU_SIZE   = 3
+_LR_MTU_LEN      = _ECPUBSIZE+_LINK_MTU_SIZE
+_LP_BASE_LEN     = _SIGLENGTH_BYTES+_ECPUB_HALF
+_LP_MTU_LEN      = _LP_BASE_LEN+_LINK_MTU_SIZE
+
+_KA_PING         = b"\xff"
+_KA_PONG         = b"\xfe"
+
+_LR_NOMTU        = struct.Struct("32s32s")
+_LR_WITHMTU      = struct.Struct("32s32s3s")
+
+_time            = time.time
+_monotonic       = time.monotonic
+
+# RNS.log and RNS.prettyhexrep are not yet defined when this module is
+# imported during package initialization, so hot call sites go through
+# these names, which are rebound to the real functions the first time a
+# link processes a packet.
+def _log(msg, level=3):
+    return RNS.log(msg, level)
+
+def _pretty(data):
+    return RNS.prettyhexrep(data)
+
+_VERIFY_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="rns-link-verify")
+
+_CALLBACK_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="rns-link-cb")
+
+@functools.lru_cache(maxsize=None)
+def _mdu_for_mtu(mtu):
+    return math.floor((mtu-RNS.Reticulum.IFAC_MIN_SIZE-RNS.Reticulum.HEADER_MINSIZE-RNS.Identity.TOKEN_OVERHEAD)/RNS.Identity.AES128_BLOCKSIZE)*RNS.Identity.AES128_BLOCKSIZE - 1
+
+class WatchdogService:
+    """
+    A single shared service thread that runs scheduled jobs from a
+    deadline-ordered heap, so that links do not need a dedicated
+    watchdog thread each. A scheduled callback is called with no
+    arguments and must return the delay in seconds until it should run
+    again, or *None* to stop being scheduled.
+    """
+    _instance      = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def instance():
+        if WatchdogService._instance == None:
+            with WatchdogService._instance_lock:
+                if WatchdogService._instance == None:
+                    WatchdogService._instance = WatchdogService()
+        return WatchdogService._instance
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+    def schedule(self, callback, delay):
+        with self._condition:
+            self._sequence += 1
+            entry = [time.monotonic()+delay, self._sequence, callback]
+            heapq.heappush(self._heap, entry)
+            self._condition.notify()
+        return entry
+
+    def cancel(self, entry):
+        # Lazy cancellation: the entry stays queued until its deadline,
+        # but its callback reference is dropped immediately and the job
+        # is skipped when it reaches the front of the heap.
+        entry[2] = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while len(self._heap) == 0:
+                    self._condition.wait()
+
+                deadline, sequence, callback = self._heap[0]
+                wait_time = deadline - time.monotonic()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+
+                heapq.heappop(self._heap)
+                if callback == None:
+                    continue
+
+            try:
+                next_delay = callback()
+            except Exception as e:
+                next_delay = None
+                RNS.log("An error occurred in a scheduled watchdog job. The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+            if next_delay != None:
+                self.schedule(callback, next_delay)
+
+class _KeyPool:
+    """
+    Maintains small background-filled pools of pre-generated X25519 and
+    Ed25519 keypairs, so that link establishment can pop a ready keypair
+    with its public key already computed, instead of blocking on key
+    generation and scalar multiplication in the critical path.
+    """
+    POOL_SIZE     = 16
+    FILL_INTERVAL = 0.05
+
+    _x25519_pool     = queue.Queue(maxsize=POOL_SIZE)
+    _ed25519_pool    = queue.Queue(maxsize=POOL_SIZE)
+    _filler_lock     = threading.Lock()
+    _fillers_started = False
+
+    @staticmethod
+    def _start_fillers():
+        with _KeyPool._filler_lock:
+            if not _KeyPool._fillers_started:
+                _KeyPool._fillers_started = True
+                for pool, generate in ((_KeyPool._x25519_pool, X25519PrivateKey.generate),
+                                       (_KeyPool._ed25519_pool, Ed25519PrivateKey.generate)):
+                    thread = threading.Thread(target=_KeyPool._filler_job, args=(pool, generate))
+                    thread.daemon = True
+                    thread.start()
+
+    @staticmethod
+    def _filler_job(pool, generate):
+        # Pace the refill so that background key generation does not
+        # starve concurrent link establishment of interpreter time.
+        while True:
+            prv = generate()
+            pool.put((prv, prv.public_key()))
+            sleep(_KeyPool.FILL_INTERVAL)
+
+    @staticmethod
+    def get_x25519():
+        if not _KeyPool._fillers_started: _KeyPool._start_fillers()
+        try: return _KeyPool._x25519_pool.get_nowait()
+        except queue.Empty:
+            prv = X25519PrivateKey.generate()
+            return prv, prv.public_key()
+
+    @staticmethod
+    def get_ed25519():
+        if not _KeyPool._fillers_started: _KeyPool._start_fillers()
+        try: return _KeyPool._ed25519_pool.get_nowait()
+        except queue.Empty:
+            prv = Ed25519PrivateKey.generate()
+            return prv, prv.public_key()
 
 class LinkCallbacks:
+    __slots__ = ("link_established", "link_closed", "packet", "resource",
+                 "resource_started", "resource_concluded", "remote_identified")
+
     def __init__(self):
         self.link_established = None
         self.link_closed = None
@@ -68,7 +235,7 @@ class Link:
     The curve used for Elliptic Curve DH key exchanges
     """
 
-    ECPUBSIZE         = 32+32
+    ECPUBSIZE         = _ECPUBSIZE
     KEYSIZE           = 32
 
     MDU = math.floor((RNS.Reticulum.MTU-RNS.Reticulum.IFAC_MIN_SIZE-RNS.Reticulum.HEADER_MINSIZE-RNS.Identity.TOKEN_OVERHEAD)/RNS.Identity.AES128_BLOCKSIZE)*RNS.Identity.AES128_BLOCKSIZE - 1
@@ -78,7 +245,7 @@ class Link:
     Timeout for link establishment in seconds per hop to destination.
     """
 
-    LINK_MTU_SIZE            = 3
+    LINK_MTU_SIZE            = _LINK_MTU_SIZE
     TRAFFIC_TIMEOUT_MIN_MS   = 5
     TRAFFIC_TIMEOUT_FACTOR   = 6
     KEEPALIVE_MAX_RTT        = 1.75
@@ -121,7 +288,7 @@ class Link:
     ACCEPT_NONE         = 0x00
     ACCEPT_APP          = 0x01
     ACCEPT_ALL          = 0x02
-    resource_strategies = [ACCEPT_NONE, ACCEPT_APP, ACCEPT_ALL]
+    resource_strategies = frozenset([ACCEPT_NONE, ACCEPT_APP, ACCEPT_ALL])
 
     MODE_AES128_CBC     = 0x00
     MODE_AES256_CBC     = 0x01
@@ -131,7 +298,7 @@ class Link:
     MODE_PQ_RESERVED_2  = 0x05
     MODE_PQ_RESERVED_3  = 0x06
     MODE_PQ_RESERVED_4  = 0x07
-    ENABLED_MODES       = [MODE_AES256_CBC]
+    ENABLED_MODES       = frozenset([MODE_AES256_CBC])
     MODE_DEFAULT        =  MODE_AES256_CBC
     MODE_DESCRIPTIONS   = {MODE_AES128_CBC: "AES_128_CBC",
                            MODE_AES256_CBC: "AES_256_CBC",
@@ -149,19 +316,18 @@ class Link:
     def signalling_bytes(mtu, mode):
         if not mode in Link.ENABLED_MODES: raise TypeError(f"Requested link mode {Link.MODE_DESCRIPTIONS[mode]} not enabled")
         signalling_value = (mtu & Link.MTU_BYTEMASK)+(((mode<<5) & Link.MODE_BYTEMASK)<<16)
-        return struct.pack(">I", signalling_value)[1:]
+        return signalling_value.to_bytes(3, "big")
 
     @staticmethod
     def mtu_from_lr_packet(packet):
-        if len(packet.data) == Link.ECPUBSIZE+Link.LINK_MTU_SIZE:
-            return (packet.data[Link.ECPUBSIZE] << 16) + (packet.data[Link.ECPUBSIZE+1] << 8) + (packet.data[Link.ECPUBSIZE+2]) & Link.MTU_BYTEMASK
+        if len(packet.data) == _LR_MTU_LEN:
+            return int.from_bytes(packet.data[_ECPUBSIZE:_LR_MTU_LEN], "big") & Link.MTU_BYTEMASK
         else: return None
 
     @staticmethod
     def mtu_from_lp_packet(packet):
-        if len(packet.data) == RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2+Link.LINK_MTU_SIZE:
-            mtu_bytes = packet.data[RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2:RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2+Link.LINK_MTU_SIZE]
-            return (mtu_bytes[0] << 16) + (mtu_bytes[1] << 8) + (mtu_bytes[2]) & Link.MTU_BYTEMASK
+        if len(packet.data) == _LP_MTU_LEN:
+            return int.from_bytes(packet.data[_LP_BASE_LEN:_LP_MTU_LEN], "big") & Link.MTU_BYTEMASK
         else: return None
 
     @staticmethod
@@ -171,26 +337,28 @@ class Link:
 
     @staticmethod
     def mode_from_lr_packet(packet):
-        if len(packet.data) > Link.ECPUBSIZE:
-            mode = (packet.data[Link.ECPUBSIZE] & Link.MODE_BYTEMASK) >> 5
+        if len(packet.data) > _ECPUBSIZE:
+            mode = (packet.data[_ECPUBSIZE] & Link.MODE_BYTEMASK) >> 5
             return mode
         else: return Link.MODE_DEFAULT
 
     @staticmethod
     def mode_from_lp_packet(packet):
-        if len(packet.data) > RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2:
-            mode = packet.data[RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2] >> 5
+        if len(packet.data) > _LP_BASE_LEN:
+            mode = packet.data[_LP_BASE_LEN] >> 5
             return mode
         else: return Link.MODE_DEFAULT
 
     @staticmethod
     def validate_request(owner, data, packet):
-        if len(data) == Link.ECPUBSIZE or len(data) == Link.ECPUBSIZE+Link.LINK_MTU_SIZE:
+        if len(data) == _ECPUBSIZE or len(data) == _LR_MTU_LEN:
             try:
-                link = Link(owner = owner, peer_pub_bytes=data[:Link.ECPUBSIZE//2], peer_sig_pub_bytes=data[Link.ECPUBSIZE//2:Link.ECPUBSIZE])
+                if len(data) == _ECPUBSIZE: peer_pub_bytes, peer_sig_pub_bytes = _LR_NOMTU.unpack_from(data)
+                else: peer_pub_bytes, peer_sig_pub_bytes, _ = _LR_WITHMTU.unpack_from(data)
+                link = Link(owner = owner, peer_pub_bytes=peer_pub_bytes, peer_sig_pub_bytes=peer_sig_pub_bytes)
                 link.set_link_id(packet)
 
-                if len(data) == Link.ECPUBSIZE+Link.LINK_MTU_SIZE:
+                if len(data) == _LR_MTU_LEN:
                     RNS.log("Link request includes MTU signalling", RNS.LOG_DEBUG) # TODO: Remove debug
                     try:
                         link.mtu = Link.mtu_from_lr_packet(packet) or Reticulum.MTU
@@ -213,9 +381,10 @@ class Link:
                 link.handshake()
                 link.attached_interface = packet.receiving_interface
                 link.prove()
-                link.request_time = time.time()
+                now = time.monotonic()
+                link.request_time = now
                 RNS.Transport.register_link(link)
-                link.last_inbound = time.time()
+                link.last_inbound = now
                 link.__update_phy_stats(packet, force_update=True)
                 link.start_watchdog()
 
@@ -243,9 +412,11 @@ class Link:
         self.resource_strategy = Link.ACCEPT_NONE
         self.last_resource_window = None
         self.last_resource_eifr = None
-        self.outgoing_resources = []
-        self.incoming_resources = []
-        self.pending_requests   = []
+        self._outgoing_by_id    = {}
+        self._incoming_by_id    = {}
+        self._outgoing_by_hash  = {}
+        self._incoming_by_hash  = {}
+        self._pending_by_id     = {}
         self.last_inbound = 0
         self.last_outbound = 0
         self.last_keepalive = 0
@@ -262,7 +433,10 @@ class Link:
         self.keepalive_timeout_factor = Link.KEEPALIVE_TIMEOUT_FACTOR
         self.keepalive = Link.KEEPALIVE
         self.stale_time = Link.STALE_TIME
-        self.watchdog_lock = False
+        self._stale_sleep = Link.STALE_GRACE
+        self._rx_lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        self._closed_once = False
         self.status = Link.PENDING
         self.activated_at = None
         self.type = RNS.Destination.LINK
@@ -272,27 +446,24 @@ class Link:
         self.attached_interface = None
         self.__remote_identity = None
         self.__track_phy_stats = False
+        self._reticulum = RNS.Reticulum.get_instance()
         self._channel = None
 
         if self.destination == None:
             self.initiator = False
-            self.prv     = X25519PrivateKey.generate()
+            self.prv, self.pub = _KeyPool.get_x25519()
             self.sig_prv = self.owner.identity.sig_prv
+            self.sig_pub = self.sig_prv.public_key()
         else:
             self.initiator = True
-            self.expected_hops = RNS.Transport.hops_to(self.destination.hash)
+            hops = RNS.Transport.hops_to(self.destination.hash)
+            self.expected_hops = hops
             self.establishment_timeout  = RNS.Reticulum.get_instance().get_first_hop_timeout(destination.hash)
-            self.establishment_timeout += Link.ESTABLISHMENT_TIMEOUT_PER_HOP * max(1, RNS.Transport.hops_to(destination.hash))
-            self.prv     = X25519PrivateKey.generate()
-            self.sig_prv = Ed25519PrivateKey.generate()
+            self.establishment_timeout += Link.ESTABLISHMENT_TIMEOUT_PER_HOP * max(1, hops)
+            self.prv, self.pub         = _KeyPool.get_x25519()
+            self.sig_prv, self.sig_pub = _KeyPool.get_ed25519()
 
         self.token  = None
-        
-        self.pub = self.prv.public_key()
-        self.pub_bytes = self.pub.public_bytes()
-
-        self.sig_pub = self.sig_prv.public_key()
-        self.sig_pub_bytes = self.sig_pub.public_bytes()
 
         if peer_pub_bytes == None:
             self.peer_pub = None
@@ -314,13 +485,13 @@ class Link:
                 RNS.log(f"Signalling link MTU of {RNS.prettysize(nh_hw_mtu)} for link", RNS.LOG_DEBUG) # TODO: Remove debug
             else: signalling_bytes = Link.signalling_bytes(RNS.Reticulum.MTU, self.mode)
             RNS.log(f"Establishing link with mode {Link.MODE_DESCRIPTIONS[self.mode]}", RNS.LOG_DEBUG) # TODO: Remove debug
-            self.request_data = self.pub_bytes+self.sig_pub_bytes+signalling_bytes
+            self.request_data = b"".join((self.pub_bytes, self.sig_pub_bytes, signalling_bytes))
             self.packet = RNS.Packet(destination, self.request_data, packet_type=RNS.Packet.LINKREQUEST)
             self.packet.pack()
             self.establishment_cost += len(self.packet.raw)
             self.set_link_id(self.packet)
             RNS.Transport.register_link(self)
-            self.request_time = time.time()
+            self.request_time = time.monotonic()
             self.start_watchdog()
             self.packet.send()
             self.had_outbound()
@@ -328,6 +499,14 @@ class Link:
             RNS.log(f"Establishment timeout is {RNS.prettytime(self.establishment_timeout)} for link request "+RNS.prettyhexrep(self.link_id), RNS.LOG_EXTREME)
 
 
+    @functools.cached_property
+    def pub_bytes(self):
+        return self.pub.public_bytes()
+
+    @functools.cached_property
+    def sig_pub_bytes(self):
+        return self.sig_pub.public_bytes()
+
     def load_peer(self, peer_pub_bytes, peer_sig_pub_bytes):
         self.peer_pub_bytes = peer_pub_bytes
         self.peer_pub = X25519PublicKey.from_public_bytes(self.peer_pub_bytes)
@@ -366,15 +545,19 @@ class Link:
                 salt=self.get_salt(),
                 context=self.get_context())
 
+            # Instantiate the token as soon as key material is available,
+            # so the per-packet encrypt and decrypt paths never have to.
+            self.token = Token(self.derived_key)
+
         else: RNS.log("Handshake attempt on "+str(self)+" with invalid state "+str(self.status), RNS.LOG_ERROR)
 
 
     def prove(self):
         signalling_bytes = Link.signalling_bytes(self.mtu, self.mode)
-        signed_data = self.link_id+self.pub_bytes+self.sig_pub_bytes+signalling_bytes
+        signed_data = b"".join((self.link_id, self.pub_bytes, self.sig_pub_bytes, signalling_bytes))
         signature = self.owner.identity.sign(signed_data)
 
-        proof_data = signature+self.pub_bytes+signalling_bytes
+        proof_data = b"".join((signature, self.pub_bytes, signalling_bytes))
         proof = RNS.Packet(self, proof_data, packet_type=RNS.Packet.PROOF, context=RNS.Packet.LRPROOF)
         proof.send()
         self.establishment_cost += len(proof.raw)
@@ -397,60 +580,79 @@ class Link:
     def validate_proof(self, packet):
         try:
             if self.status == Link.PENDING:
+                mv = memoryview(packet.data)
                 signalling_bytes = b""
                 confirmed_mtu = None
                 mode = Link.mode_from_lp_packet(packet)
                 RNS.log(f"Validating link request proof with mode {Link.MODE_DESCRIPTIONS[mode]}", RNS.LOG_DEBUG) # TODO: Remove debug
                 if mode != self.mode: raise TypeError(f"Invalid link mode {mode} in link request proof")
-                if len(packet.data) == RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2+Link.LINK_MTU_SIZE:
+                if len(mv) == _LP_MTU_LEN:
                     confirmed_mtu = Link.mtu_from_lp_packet(packet)
                     signalling_bytes = Link.signalling_bytes(confirmed_mtu, mode)
-                    packet.data = packet.data[:RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2]
+                    packet.data = packet.data[:_LP_BASE_LEN]
+                    mv = mv[:_LP_BASE_LEN]
                     RNS.log(f"Destination confirmed link MTU of {RNS.prettysize(confirmed_mtu)}", RNS.LOG_DEBUG) # TODO: Remove debug
 
-                if self.initiator and len(packet.data) == RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2:
-                    peer_pub_bytes = packet.data[RNS.Identity.SIGLENGTH//8:RNS.Identity.SIGLENGTH//8+Link.ECPUBSIZE//2]
-                    peer_sig_pub_bytes = self.destination.identity.get_public_key()[Link.ECPUBSIZE//2:Link.ECPUBSIZE]
+                if self.initiator and len(mv) == _LP_BASE_LEN:
+                    peer_pub_bytes = bytes(mv[_SIGLENGTH_BYTES:_LP_BASE_LEN])
+                    peer_sig_pub_bytes = self.destination.identity.get_public_key()[_ECPUB_HALF:_ECPUBSIZE]
                     self.load_peer(peer_pub_bytes, peer_sig_pub_bytes)
                     self.handshake()
 
                     self.establishment_cost += len(packet.raw)
                     signed_data = self.link_id+self.peer_pub_bytes+self.peer_sig_pub_bytes+signalling_bytes
-                    signature = packet.data[:RNS.Identity.SIGLENGTH//8]
-                    
-                    if self.destination.identity.validate(signature, signed_data):
-                        if self.status != Link.HANDSHAKE:
-                            raise IOError("Invalid link state for proof validation: "+str(self.status))
-
-                        self.rtt = time.time() - self.request_time
-                        self.attached_interface = packet.receiving_interface
-                        self.__remote_identity = self.destination.identity
-                        self.mtu = confirmed_mtu or RNS.Reticulum.MTU
-                        self.update_mdu()
-                        self.status = Link.ACTIVE
-                        self.activated_at = time.time()
-                        self.last_proof = self.activated_at
-                        RNS.Transport.activate_link(self)
-                        RNS.log("Link "+str(self)+" established with "+str(self.destination)+", RTT is "+RNS.prettyshorttime(self.rtt), RNS.LOG_DEBUG)
-                        
-                        if self.rtt != None and self.establishment_cost != None and self.rtt > 0 and self.establishment_cost > 0:
-                            self.establishment_rate = self.establishment_cost/self.rtt
-
-                        self.__update_keepalive()
-
-                        rtt_data = umsgpack.packb(self.rtt)
-                        rtt_packet = RNS.Packet(self, rtt_data, context=RNS.Packet.LRRTT)
-                        rtt_packet.send()
-                        self.had_outbound()
-                        self.__update_phy_stats(packet)
-
-                        if self.callbacks.link_established != None:
-                            thread = threading.Thread(target=self.callbacks.link_established, args=(self,))
-                            thread.daemon = True
-                            thread.start()
-                    else:
-                        RNS.log("Invalid link proof signature received by "+str(self)+". Ignoring.", RNS.LOG_DEBUG)
-        
+                    signature = bytes(mv[:_SIGLENGTH_BYTES])
+
+                    # Signature verification is compute-bound, so it is
+                    # run on a worker thread to keep the transport
+                    # dispatch thread free for further packet handling.
+                    _VERIFY_POOL.submit(self.__finish_validate_proof, packet, signature, signed_data, confirmed_mtu)
+
+        except Exception as e:
+            self.status = Link.CLOSED
+            RNS.log("An error ocurred while validating link request proof on "+str(self)+".", RNS.LOG_ERROR)
+            RNS.log("The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def __link_established_callback_job(self):
+        try:
+            self.callbacks.link_established(self)
+        except Exception as e:
+            RNS.log("Error while executing link established callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def __finish_validate_proof(self, packet, signature, signed_data, confirmed_mtu):
+        try:
+            if self.destination.identity.validate(signature, signed_data):
+                if self.status != Link.HANDSHAKE:
+                    raise IOError("Invalid link state for proof validation: "+str(self.status))
+
+                now = time.monotonic()
+                self.rtt = now - self.request_time
+                self.attached_interface = packet.receiving_interface
+                self.__remote_identity = self.destination.identity
+                self.mtu = confirmed_mtu or RNS.Reticulum.MTU
+                self.update_mdu()
+                self.status = Link.ACTIVE
+                self.activated_at = now
+                self.last_proof = self.activated_at
+                RNS.Transport.activate_link(self)
+                RNS.log("Link "+str(self)+" established with "+str(self.destination)+", RTT is "+RNS.prettyshorttime(self.rtt), RNS.LOG_DEBUG)
+
+                if self.rtt != None and self.establishment_cost != None and self.rtt > 0 and self.establishment_cost > 0:
+                    self.establishment_rate = self.establishment_cost/self.rtt
+
+                self.__update_keepalive()
+
+                rtt_data = _packb(self.rtt)
+                rtt_packet = RNS.Packet(self, rtt_data, context=RNS.Packet.LRRTT)
+                rtt_packet.send()
+                self.had_outbound()
+                self.__update_phy_stats(packet)
+
+                if self.callbacks.link_established != None:
+                    _CALLBACK_POOL.submit(self.__link_established_callback_job)
+            else:
+                RNS.log("Invalid link proof signature received by "+str(self)+". Ignoring.", RNS.LOG_DEBUG)
+
         except Exception as e:
             self.status = Link.CLOSED
             RNS.log("An error ocurred while validating link request proof on "+str(self)+".", RNS.LOG_ERROR)
@@ -487,15 +689,17 @@ class Link:
         :param timeout: An optional timeout in seconds for the request. If *None* is supplied it will be calculated based on link RTT.
         :returns: A :ref:`RNS.RequestReceipt<api-requestreceipt>` instance if the request was sent, or *False* if it was not.
         """
-        request_path_hash = RNS.Identity.truncated_hash(path.encode("utf-8"))
+        truncated_hash    = RNS.Identity.truncated_hash
+        packet_class      = RNS.Packet
+        request_path_hash = truncated_hash(path.encode("utf-8"))
         unpacked_request  = [time.time(), request_path_hash, data]
-        packed_request    = umsgpack.packb(unpacked_request)
+        packed_request    = _packb(unpacked_request)
 
         if timeout == None:
             timeout = self.rtt * self.traffic_timeout_factor + RNS.Resource.RESPONSE_MAX_GRACE_TIME*1.125
 
         if len(packed_request) <= self.mdu:
-            request_packet   = RNS.Packet(self, packed_request, RNS.Packet.DATA, context = RNS.Packet.REQUEST)
+            request_packet   = packet_class(self, packed_request, packet_class.DATA, context = packet_class.REQUEST)
             packet_receipt   = request_packet.send()
 
             if packet_receipt == False:
@@ -513,8 +717,9 @@ class Link:
                 )
             
         else:
-            request_id = RNS.Identity.truncated_hash(packed_request)
-            RNS.log("Sending request "+RNS.prettyhexrep(request_id)+" as resource.", RNS.LOG_DEBUG)
+            request_id = truncated_hash(packed_request)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                RNS.log("Sending request "+RNS.prettyhexrep(request_id)+" as resource.", RNS.LOG_DEBUG)
             request_resource = RNS.Resource(packed_request, self, request_id = request_id, is_response = False, timeout = timeout)
 
             return RequestReceipt(
@@ -529,18 +734,18 @@ class Link:
 
 
     def update_mdu(self):
-        self.mdu = self.mtu - RNS.Reticulum.HEADER_MAXSIZE - RNS.Reticulum.IFAC_MIN_SIZE
-        self.mdu = math.floor((self.mtu-RNS.Reticulum.IFAC_MIN_SIZE-RNS.Reticulum.HEADER_MINSIZE-RNS.Identity.TOKEN_OVERHEAD)/RNS.Identity.AES128_BLOCKSIZE)*RNS.Identity.AES128_BLOCKSIZE - 1
+        self.mdu = _mdu_for_mtu(self.mtu)
 
     def rtt_packet(self, packet):
         try:
-            measured_rtt = time.time() - self.request_time
+            now = time.monotonic()
+            measured_rtt = now - self.request_time
             plaintext = self.decrypt(packet.data)
             if plaintext != None:
-                rtt = umsgpack.unpackb(plaintext)
+                rtt = _unpackb(plaintext)
                 self.rtt = max(measured_rtt, rtt)
                 self.status = Link.ACTIVE
-                self.activated_at = time.time()
+                self.activated_at = now
 
                 if self.rtt != None and self.establishment_cost != None and self.rtt > 0 and self.establishment_cost > 0:
                     self.establishment_rate = self.establishment_cost/self.rtt
@@ -651,7 +856,7 @@ class Link:
         :returns: The time in seconds since this link was established.
         """
         if self.activated_at:
-            return time.time() - self.activated_at
+            return time.monotonic() - self.activated_at
         else:
             return None
 
@@ -661,19 +866,19 @@ class Link:
         """
         activated_at = self.activated_at if self.activated_at != None else 0
         last_inbound = max(self.last_inbound, activated_at)
-        return time.time() - last_inbound
+        return time.monotonic() - last_inbound
 
     def no_outbound_for(self):
         """
         :returns: The time in seconds since last outbound packet on the link. This includes keepalive packets.
         """
-        return time.time() - self.last_outbound
+        return time.monotonic() - self.last_outbound
 
     def no_data_for(self):
         """
         :returns: The time in seconds since payload data traversed the link. This excludes keepalive packets.
         """
-        return time.time() - self.last_data
+        return time.monotonic() - self.last_data
 
     def inactive_for(self):
         """
@@ -688,14 +893,23 @@ class Link:
         return self.__remote_identity
 
     def had_outbound(self, is_keepalive=False):
-        self.last_outbound = time.time()
-        if not is_keepalive: self.last_data = self.last_outbound
-        else:                self.last_keepalive = self.last_outbound
+        if not is_keepalive: self._had_outbound_data()
+        else:                self._had_outbound_keepalive()
+
+    def _had_outbound_data(self):
+        now = time.monotonic()
+        self.last_outbound = now
+        self.last_data = now
+
+    def _had_outbound_keepalive(self):
+        now = time.monotonic()
+        self.last_outbound = now
+        self.last_keepalive = now
 
     def __teardown_packet(self):
         teardown_packet = RNS.Packet(self, self.link_id, context=RNS.Packet.LINKCLOSE)
         teardown_packet.send()
-        self.had_outbound()
+        self._had_outbound_data()
 
     def teardown(self):
         """
@@ -723,10 +937,11 @@ class Link:
             pass
 
     def link_closed(self):
-        for resource in self.incoming_resources:
-            resource.cancel()
-        for resource in self.outgoing_resources:
-            resource.cancel()
+        with self._close_lock:
+            if self._closed_once: return
+            self._closed_once = True
+
+        self._drain_resources()
         if self._channel:
             self._channel._shutdown()
             
@@ -738,8 +953,7 @@ class Link:
 
         if self.destination != None:
             if self.destination.direction == RNS.Destination.IN:
-                if self in self.destination.links:
-                    self.destination.links.remove(self)
+                self.destination.links.pop(self.link_id, None)
 
         if self.callbacks.link_closed != None:
             try:
@@ -749,92 +963,100 @@ class Link:
 
 
     def start_watchdog(self):
-        thread = threading.Thread(target=self.__watchdog_job)
-        thread.daemon = True
-        thread.start()
+        WatchdogService.instance().schedule(self.__watchdog_pass, 0)
 
-    def __watchdog_job(self):
-        while not self.status == Link.CLOSED:
-            while (self.watchdog_lock):
-                rtt_wait = 0.025
-                if hasattr(self, "rtt") and self.rtt:
-                    rtt_wait = self.rtt
-
-                sleep(max(rtt_wait, 0.025))
-
-            if not self.status == Link.CLOSED:
-                # Link was initiated, but no response
-                # from destination yet
-                if self.status == Link.PENDING:
-                    next_check = self.request_time + self.establishment_timeout
-                    sleep_time = next_check - time.time()
-                    if time.time() >= self.request_time + self.establishment_timeout:
-                        RNS.log("Link establishment timed out", RNS.LOG_VERBOSE)
-                        self.status = Link.CLOSED
-                        self.teardown_reason = Link.TIMEOUT
-                        self.link_closed()
-                        sleep_time = 0.001
-
-                elif self.status == Link.HANDSHAKE:
-                    next_check = self.request_time + self.establishment_timeout
-                    sleep_time = next_check - time.time()
-                    if time.time() >= self.request_time + self.establishment_timeout:
-                        self.status = Link.CLOSED
-                        self.teardown_reason = Link.TIMEOUT
-                        self.link_closed()
-                        sleep_time = 0.001
-
-                        if self.initiator:
-                            RNS.log("Timeout waiting for link request proof", RNS.LOG_DEBUG)
-                        else:
-                            RNS.log("Timeout waiting for RTT packet from link initiator", RNS.LOG_DEBUG)
+    def __watchdog_pass(self):
+        if not self.__track_phy_stats:
+            self.rssi = None
+            self.snr  = None
+            self.q    = None
 
-                elif self.status == Link.ACTIVE:
-                    activated_at = self.activated_at if self.activated_at != None else 0
-                    last_inbound = max(max(self.last_inbound, self.last_proof), activated_at)
-                    now = time.time()
+        if self.status == Link.CLOSED:
+            return None
 
-                    if now >= last_inbound + self.keepalive:
-                        if self.initiator and now >= self.last_keepalive + self.keepalive:
-                            self.send_keepalive()
+        # Serialise with packet processing. A blocking acquire wakes this
+        # pass the moment receive() releases the lock, instead of polling
+        # a busy-flag on a fixed interval. The timeout only guards against
+        # a stalled receive call holding up other scheduled jobs.
+        if not self._rx_lock.acquire(timeout=0.5):
+            return 0.025
 
-                        if time.time() >= last_inbound + self.stale_time:
-                            sleep_time = self.rtt * self.keepalive_timeout_factor + Link.STALE_GRACE
-                            self.status = Link.STALE
-                        else:
-                            sleep_time = self.keepalive
-                    
-                    else:
-                        sleep_time = (last_inbound + self.keepalive) - time.time()
+        try:
+            return self.__watchdog_evaluate()
+        finally:
+            self._rx_lock.release()
+
+    def __watchdog_evaluate(self):
+        sleep_time = None
+        now = time.monotonic()
+
+        # Link was initiated, but no response
+        # from destination yet
+        if self.status == Link.PENDING:
+            next_check = self.request_time + self.establishment_timeout
+            sleep_time = next_check - now
+            if now >= next_check:
+                RNS.log("Link establishment timed out", RNS.LOG_VERBOSE)
+                self.status = Link.CLOSED
+                self.teardown_reason = Link.TIMEOUT
+                self.link_closed()
+                return None
+
+        elif self.status == Link.HANDSHAKE:
+            next_check = self.request_time + self.establishment_timeout
+            sleep_time = next_check - now
+            if now >= next_check:
+                self.status = Link.CLOSED
+                self.teardown_reason = Link.TIMEOUT
+                self.link_closed()
+
+                if self.initiator:
+                    RNS.log("Timeout waiting for link request proof", RNS.LOG_DEBUG)
+                else:
+                    RNS.log("Timeout waiting for RTT packet from link initiator", RNS.LOG_DEBUG)
+
+                return None
 
-                elif self.status == Link.STALE:
-                    sleep_time = 0.001
-                    self.__teardown_packet()
-                    self.status = Link.CLOSED
-                    self.teardown_reason = Link.TIMEOUT
-                    self.link_closed()
+        elif self.status == Link.ACTIVE:
+            activated_at = self.activated_at if self.activated_at != None else 0
+            last_inbound = max(max(self.last_inbound, self.last_proof), activated_at)
 
+            if now >= last_inbound + self.keepalive:
+                if self.initiator and now >= self.last_keepalive + self.keepalive:
+                    self.send_keepalive()
 
-                if sleep_time == 0:
-                    RNS.log("Warning! Link watchdog sleep time of 0!", RNS.LOG_ERROR)
-                if sleep_time == None or sleep_time < 0:
-                    RNS.log("Timing error! Tearing down link "+str(self)+" now.", RNS.LOG_ERROR)
-                    self.teardown()
-                    sleep_time = 0.1
+                if now >= last_inbound + self.stale_time:
+                    sleep_time = self._stale_sleep
+                    self.status = Link.STALE
+                else:
+                    sleep_time = self.keepalive
 
-                sleep_time = min(sleep_time, Link.WATCHDOG_MAX_SLEEP)
-                sleep(sleep_time)
+            else:
+                sleep_time = (last_inbound + self.keepalive) - now
 
-                if not self.__track_phy_stats:
-                    self.rssi = None
-                    self.snr  = None
-                    self.q    = None
+        elif self.status == Link.STALE:
+            self.__teardown_packet()
+            self.status = Link.CLOSED
+            self.teardown_reason = Link.TIMEOUT
+            self.link_closed()
+            return None
+
+        if sleep_time == 0:
+            RNS.log("Warning! Link watchdog sleep time of 0!", RNS.LOG_ERROR)
+        if sleep_time == None or sleep_time < 0:
+            RNS.log("Timing error! Tearing down link "+str(self)+" now.", RNS.LOG_ERROR)
+            self.teardown()
+            sleep_time = 0.1
+
+        return min(sleep_time, Link.WATCHDOG_MAX_SLEEP)
 
 
     def __update_phy_stats(self, packet, query_shared = True, force_update = False):
-        if self.__track_phy_stats or force_update:
+        if not self.__track_phy_stats and not force_update: return
+        else:
             if query_shared:
-                reticulum = RNS.Reticulum.get_instance()
+                reticulum = self._reticulum
+                if reticulum == None: reticulum = self._reticulum = RNS.Reticulum.get_instance()
                 if packet.rssi == None: packet.rssi = reticulum.get_packet_rssi(packet.packet_hash)
                 if packet.snr  == None: packet.snr  = reticulum.get_packet_snr(packet.packet_hash)
                 if packet.q    == None: packet.q    = reticulum.get_packet_q(packet.packet_hash)
@@ -849,11 +1071,12 @@ class Link:
     def __update_keepalive(self):
         self.keepalive = max(min(self.rtt*(Link.KEEPALIVE_MAX/Link.KEEPALIVE_MAX_RTT), Link.KEEPALIVE_MAX), Link.KEEPALIVE_MIN)
         self.stale_time = self.keepalive * Link.STALE_FACTOR
+        self._stale_sleep = self.rtt * self.keepalive_timeout_factor + Link.STALE_GRACE
     
     def send_keepalive(self):
-        keepalive_packet = RNS.Packet(self, bytes([0xFF]), context=RNS.Packet.KEEPALIVE)
+        keepalive_packet = RNS.Packet(self, _KA_PING, context=RNS.Packet.KEEPALIVE)
         keepalive_packet.send()
-        self.had_outbound(is_keepalive = True)
+        self._had_outbound_keepalive()
 
     def handle_request(self, request_id, unpacked_request):
         if self.status == Link.ACTIVE:
@@ -868,20 +1091,19 @@ class Link:
                 allow              = request_handler[2]
                 allowed_list       = request_handler[3]
                 auto_compress      = request_handler[4]
+                arity              = request_handler[5]
 
-                allowed = False
-                if not allow == RNS.Destination.ALLOW_NONE:
-                    if allow == RNS.Destination.ALLOW_LIST:
-                        if self.__remote_identity != None and self.__remote_identity.hash in allowed_list:
-                            allowed = True
-                    elif allow == RNS.Destination.ALLOW_ALL:
-                        allowed = True
+                remote_identity = self.__remote_identity
+                allowed = allow == RNS.Destination.ALLOW_ALL or \
+                          (allow == RNS.Destination.ALLOW_LIST and \
+                           remote_identity != None and remote_identity.hash in allowed_list)
 
                 if allowed:
-                    RNS.log("Handling request "+RNS.prettyhexrep(request_id)+" for: "+str(path), RNS.LOG_DEBUG)
-                    if len(inspect.signature(response_generator).parameters) == 5:
+                    if RNS.loglevel >= RNS.LOG_DEBUG:
+                        RNS.log("Handling request "+RNS.prettyhexrep(request_id)+" for: "+str(path), RNS.LOG_DEBUG)
+                    if arity == 5:
                         response = response_generator(path, request_data, request_id, self.__remote_identity, requested_at)
-                    elif len(inspect.signature(response_generator).parameters) == 6:
+                    elif arity == 6:
                         response = response_generator(path, request_data, request_id, self.link_id, self.__remote_identity, requested_at)
                     else:
                         raise TypeError("Invalid signature for response generator callback")
@@ -899,40 +1121,35 @@ class Link:
                         if file_response:
                             response_resource = RNS.Resource(file_handle, self, metadata=metadata, request_id = request_id, is_response = True, auto_compress=auto_compress)
                         else:
-                            packed_response = umsgpack.packb([request_id, response])
+                            packed_response = _packb([request_id, response])
                             if len(packed_response) <= self.mdu:
                                 RNS.Packet(self, packed_response, RNS.Packet.DATA, context = RNS.Packet.RESPONSE).send()
                             else:
                                 response_resource = RNS.Resource(packed_response, self, request_id = request_id, is_response = True, auto_compress=auto_compress)
                 else:
-                    identity_string = str(self.get_remote_identity()) if self.get_remote_identity() != None else "<Unknown>"
-                    RNS.log("Request "+RNS.prettyhexrep(request_id)+" from "+identity_string+" not allowed for: "+str(path), RNS.LOG_DEBUG)
+                    if RNS.loglevel >= RNS.LOG_DEBUG:
+                        identity_string = str(self.get_remote_identity()) if self.get_remote_identity() != None else "<Unknown>"
+                        RNS.log("Request "+RNS.prettyhexrep(request_id)+" from "+identity_string+" not allowed for: "+str(path), RNS.LOG_DEBUG)
 
     def handle_response(self, request_id, response_data, response_size, response_transfer_size, metadata=None):
         if self.status == Link.ACTIVE:
-            remove = None
-            for pending_request in self.pending_requests:
-                if pending_request.request_id == request_id:
-                    remove = pending_request
-                    try:
-                        pending_request.response_size = response_size
-                        if pending_request.response_transfer_size == None:
-                            pending_request.response_transfer_size = 0
-                        pending_request.response_transfer_size += response_transfer_size
-                        pending_request.response_received(response_data, metadata)
-                    except Exception as e:
-                        RNS.log("Error occurred while handling response. The contained exception was: "+str(e), RNS.LOG_ERROR)
-
-                    break
+            pending_request = self._pending_by_id.get(request_id)
+            if pending_request != None:
+                try:
+                    pending_request.response_size = response_size
+                    if pending_request.response_transfer_size == None:
+                        pending_request.response_transfer_size = 0
+                    pending_request.response_transfer_size += response_transfer_size
+                    pending_request.response_received(response_data, metadata)
+                except Exception as e:
+                    RNS.log("Error occurred while handling response. The contained exception was: "+str(e), RNS.LOG_ERROR)
 
-            if remove != None:
-                if remove in self.pending_requests:
-                    self.pending_requests.remove(remove)
+                self._pending_by_id.pop(request_id, None)
 
     def request_resource_concluded(self, resource):
         if resource.status == RNS.Resource.COMPLETE:
             packed_request    = resource.data.read()
-            unpacked_request  = umsgpack.unpackb(packed_request)
+            unpacked_request  = _unpackb(packed_request)
             request_id        = RNS.Identity.truncated_hash(packed_request)
             request_data      = unpacked_request
 
@@ -952,16 +1169,16 @@ class Link:
             # pass the unpacked structure to the handler
             else:
                 packed_response   = resource.data.read()
-                unpacked_response = umsgpack.unpackb(packed_response)
+                unpacked_response = _unpackb(packed_response)
                 request_id        = unpacked_response[0]
                 response_data     = unpacked_response[1]
                 self.handle_response(request_id, response_data, resource.total_size, resource.size)
 
         else:
             RNS.log("Incoming response resource failed with status: "+RNS.hexrep([resource.status]), RNS.LOG_DEBUG)
-            for pending_request in self.pending_requests:
-                if pending_request.request_id == resource.request_id:
-                    pending_request.request_timed_out(None)
+            pending_request = self._pending_by_id.get(resource.request_id)
+            if pending_request != None:
+                pending_request.request_timed_out(None)
 
     def get_channel(self):
         """
@@ -973,229 +1190,283 @@ class Link:
             self._channel = Channel(LinkChannelOutlet(self))
         return self._channel
 
+    # Dispatch tables mapping packet contexts to handler methods. These
+    # are built on first packet reception, since the RNS.Packet constants
+    # are not yet available when this module is imported.
+    _DATA_HANDLERS  = None
+    _PROOF_HANDLERS = None
+
+    @classmethod
+    def _build_dispatch_tables(cls):
+        global _log, _pretty
+        _log    = RNS.log
+        _pretty = RNS.prettyhexrep
+
+        packet_class = RNS.Packet
+        cls._PT_DATA      = packet_class.DATA
+        cls._PT_PROOF     = packet_class.PROOF
+        cls._CX_KEEPALIVE = packet_class.KEEPALIVE
+        cls._MAPHASH_LEN       = RNS.Resource.MAPHASH_LEN
+        cls._HASHMAP_EXHAUSTED = RNS.Resource.HASHMAP_IS_EXHAUSTED
+        cls._PROOF_HANDLERS = {
+            packet_class.RESOURCE_PRF: cls._rx_resource_prf,
+        }
+        cls._DATA_HANDLERS = {
+            packet_class.NONE:         cls._rx_none,
+            packet_class.LINKIDENTIFY: cls._rx_linkidentify,
+            packet_class.REQUEST:      cls._rx_request,
+            packet_class.RESPONSE:     cls._rx_response,
+            packet_class.LRRTT:        cls._rx_lrrtt,
+            packet_class.LINKCLOSE:    cls._rx_linkclose,
+            packet_class.RESOURCE_ADV: cls._rx_resource_adv,
+            packet_class.RESOURCE_REQ: cls._rx_resource_req,
+            packet_class.RESOURCE_HMU: cls._rx_resource_hmu,
+            packet_class.RESOURCE_ICL: cls._rx_resource_icl,
+            packet_class.RESOURCE_RCL: cls._rx_resource_rcl,
+            packet_class.KEEPALIVE:    cls._rx_keepalive,
+            packet_class.RESOURCE:     cls._rx_resource,
+            packet_class.CHANNEL:      cls._rx_channel,
+        }
+
+    def _rx_none(self, packet):
+        plaintext = self.decrypt(packet.data)
+        packet.ratchet_id = self.link_id
+        if plaintext != None:
+            self.__update_phy_stats(packet, query_shared=True)
+
+            if self.callbacks.packet != None:
+                _CALLBACK_POOL.submit(self.__packet_callback_job, plaintext, packet)
+
+            if self.destination.proof_strategy == RNS.Destination.PROVE_ALL:
+                packet.prove()
+
+            elif self.destination.proof_strategy == RNS.Destination.PROVE_APP:
+                if self.destination.callbacks.proof_requested:
+                    try:
+                        if self.destination.callbacks.proof_requested(packet):
+                            packet.prove()
+                    except Exception as e:
+                        RNS.log("Error while executing proof request callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def __packet_callback_job(self, plaintext, packet):
+        try:
+            self.callbacks.packet(plaintext, packet)
+        except Exception as e:
+            RNS.log("Error while executing packet callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def _rx_linkidentify(self, packet):
+        plaintext = self.decrypt(packet.data)
+        if plaintext != None:
+            if not self.initiator and len(plaintext) == _ID_PUBSIG_LEN:
+                public_key   = plaintext[:_ID_KEY_B]
+                signed_data  = self.link_id+public_key
+                signature    = plaintext[_ID_KEY_B:_ID_PUBSIG_LEN]
+                identity     = RNS.Identity(create_keys=False)
+                identity.load_public_key(public_key)
+
+                if identity.validate(signature, signed_data):
+                    self.__remote_identity = identity
+                    if self.callbacks.remote_identified != None:
+                        try:
+                            self.callbacks.remote_identified(self, self.__remote_identity)
+                        except Exception as e:
+                            RNS.log("Error while executing remote identified callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+                    self.__update_phy_stats(packet, query_shared=True)
+
+    def _rx_request(self, packet):
+        try:
+            request_id = packet.getTruncatedHash()
+            packed_request = self.decrypt(packet.data)
+            if packed_request != None:
+                unpacked_request = _unpackb(packed_request)
+                self.handle_request(request_id, unpacked_request)
+                self.__update_phy_stats(packet, query_shared=True)
+        except Exception as e:
+            RNS.log("Error occurred while handling request. The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def _rx_response(self, packet):
+        try:
+            packed_response = self.decrypt(packet.data)
+            if packed_response != None:
+                unpacked_response = _unpackb(packed_response)
+                request_id = unpacked_response[0]
+                response_data = unpacked_response[1]
+                transfer_size = len(packed_response)
+                self.handle_response(request_id, response_data, transfer_size, transfer_size)
+                self.__update_phy_stats(packet, query_shared=True)
+        except Exception as e:
+            RNS.log("Error occurred while handling response. The contained exception was: "+str(e), RNS.LOG_ERROR)
+
+    def _rx_lrrtt(self, packet):
+        if not self.initiator:
+            self.rtt_packet(packet)
+            self.__update_phy_stats(packet, query_shared=True)
+
+    def _rx_linkclose(self, packet):
+        self.teardown_packet(packet)
+        self.__update_phy_stats(packet, query_shared=True)
+
+    def _rx_resource_adv(self, packet):
+        packet.plaintext = self.decrypt(packet.data)
+        if packet.plaintext != None:
+            self.__update_phy_stats(packet, query_shared=True)
+
+            adv = RNS.ResourceAdvertisement.from_packet(packet)
+            if adv.q != None and adv.u:
+                RNS.Resource.accept(packet, callback=self.request_resource_concluded)
+            elif adv.q != None and adv.p:
+                request_id = adv.q
+                pending_request = self._pending_by_id.get(request_id)
+                if pending_request != None:
+                    response_resource = RNS.Resource.accept(packet, callback=self.response_resource_concluded, progress_callback=pending_request.response_resource_progress, request_id = request_id)
+                    if response_resource != None:
+                        if pending_request.response_size == None:
+                            pending_request.response_size = adv.d
+                        if pending_request.response_transfer_size == None:
+                            pending_request.response_transfer_size = 0
+                        pending_request.response_transfer_size += adv.t
+                        if pending_request.started_at == None:
+                            pending_request.started_at = time.monotonic()
+                        pending_request.response_resource_progress(response_resource)
+
+            elif self.resource_strategy == Link.ACCEPT_NONE:
+                pass
+            elif self.resource_strategy == Link.ACCEPT_APP:
+                if self.callbacks.resource != None:
+                    try:
+                        resource_advertisement = adv
+                        resource_advertisement.link = self
+                        if self.callbacks.resource(resource_advertisement):
+                            RNS.Resource.accept(packet, self.callbacks.resource_concluded)
+                        else:
+                            RNS.Resource.reject(packet)
+                    except Exception as e:
+                        RNS.log("Error while executing resource accept callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+            elif self.resource_strategy == Link.ACCEPT_ALL:
+                RNS.Resource.accept(packet, self.callbacks.resource_concluded)
+
+    def _rx_resource_req(self, packet):
+        plaintext = self.decrypt(packet.data)
+        if plaintext != None:
+            self.__update_phy_stats(packet, query_shared=True)
+            if plaintext[0] == Link._HASHMAP_EXHAUSTED:
+                resource_hash = plaintext[1+Link._MAPHASH_LEN:_ID_HASH_B+1+Link._MAPHASH_LEN]
+            else:
+                resource_hash = plaintext[1:_ID_HASH_B+1]
+
+            resource = self._outgoing_by_hash.get(resource_hash)
+            if resource != None:
+                # We need to check that this request has not been
+                # received before in order to avoid sequencing errors.
+                if not packet.packet_hash in resource.req_hashlist:
+                    resource.req_hashlist.append(packet.packet_hash)
+                    resource.request(plaintext)
+
+                    # TODO: Test and possibly enable this at some point
+                    # def request_job():
+                    #     resource.request(plaintext)
+                    # threading.Thread(target=request_job, daemon=True).start()
+
+    def _rx_resource_hmu(self, packet):
+        plaintext = self.decrypt(packet.data)
+        if plaintext != None:
+            self.__update_phy_stats(packet, query_shared=True)
+            resource_hash = plaintext[:_ID_HASH_B]
+            resource = self._incoming_by_hash.get(resource_hash)
+            if resource != None:
+                resource.hashmap_update_packet(plaintext)
+
+    def _rx_resource_icl(self, packet):
+        plaintext = self.decrypt(packet.data)
+        if plaintext != None:
+            self.__update_phy_stats(packet)
+            resource_hash = plaintext[:_ID_HASH_B]
+            resource = self._incoming_by_hash.get(resource_hash)
+            if resource != None:
+                resource.cancel()
+
+    def _rx_resource_rcl(self, packet):
+        plaintext = self.decrypt(packet.data)
+        if plaintext != None:
+            self.__update_phy_stats(packet)
+            resource_hash = plaintext[:_ID_HASH_B]
+            resource = self._outgoing_by_hash.get(resource_hash)
+            if resource != None:
+                resource._rejected()
+
+    def _rx_keepalive(self, packet):
+        if not self.initiator and packet.data == _KA_PING:
+            keepalive_packet = RNS.Packet(self, _KA_PONG, context=RNS.Packet.KEEPALIVE)
+            keepalive_packet.send()
+            self._had_outbound_keepalive()
+
+    # TODO: find the most efficient way to allow multiple
+    # transfers at the same time, sending resource hash on
+    # each packet is a huge overhead. Probably some kind
+    # of hash -> sequence map
+    def _rx_resource(self, packet):
+        for resource in list(self._incoming_by_id.values()):
+            resource.receive_part(packet)
+        self.__update_phy_stats(packet)
+
+    def _rx_channel(self, packet):
+        if not self._channel:
+            RNS.log(f"Channel data received without open channel", RNS.LOG_DEBUG)
+        else:
+            packet.prove()
+            plaintext = self.decrypt(packet.data)
+            if plaintext != None:
+                self.__update_phy_stats(packet)
+                self._channel._receive(plaintext)
+
+    def _rx_resource_prf(self, packet):
+        resource_hash = packet.data[0:_ID_HASH_B]
+        resource = self._outgoing_by_hash.get(resource_hash)
+        if resource != None:
+            resource.validate_proof(packet.data)
+            self.__update_phy_stats(packet, query_shared=True)
+
     def receive(self, packet):
-        self.watchdog_lock = True
-        if not self.status == Link.CLOSED and not (self.initiator and packet.context == RNS.Packet.KEEPALIVE and packet.data == bytes([0xFF])):
+        with self._rx_lock: self.__receive(packet)
+
+    def receive_batch(self, packets):
+        # Processes a burst of link-associated packets under a single
+        # lock acquisition, amortizing dispatch overhead when the
+        # transport delivers several buffered packets at once.
+        with self._rx_lock:
+            for packet in packets:
+                self.__receive(packet)
+
+    def __receive(self, packet):
+        if Link._DATA_HANDLERS == None:
+            Link._build_dispatch_tables()
+
+        if not self.status == Link.CLOSED and not (self.initiator and packet.context == Link._CX_KEEPALIVE and packet.data == _KA_PING):
             if packet.receiving_interface != self.attached_interface:
                 RNS.log(f"Link-associated packet received on unexpected interface {packet.receiving_interface} instead of {self.attached_interface}! Someone might be trying to manipulate your communication!", RNS.LOG_ERROR)
             else:
-                self.last_inbound = time.time()
-                if packet.context != RNS.Packet.KEEPALIVE:
+                self.last_inbound = _monotonic()
+                if packet.context != Link._CX_KEEPALIVE:
                     self.last_data = self.last_inbound
                 self.rx += 1
                 self.rxbytes += len(packet.data)
                 if self.status == Link.STALE:
                     self.status = Link.ACTIVE
 
-                if packet.packet_type == RNS.Packet.DATA:
-                    should_query = False
-                    if packet.context == RNS.Packet.NONE:
-                        plaintext = self.decrypt(packet.data)
-                        packet.ratchet_id = self.link_id
-                        if plaintext != None:
-                            self.__update_phy_stats(packet, query_shared=True)
-
-                            if self.callbacks.packet != None:
-                                thread = threading.Thread(target=self.callbacks.packet, args=(plaintext, packet))
-                                thread.daemon = True
-                                thread.start()
-                            
-                            if self.destination.proof_strategy == RNS.Destination.PROVE_ALL:
-                                packet.prove()
-
-                            elif self.destination.proof_strategy == RNS.Destination.PROVE_APP:
-                                if self.destination.callbacks.proof_requested:
-                                    try:
-                                        if self.destination.callbacks.proof_requested(packet):
-                                            packet.prove()
-                                    except Exception as e:
-                                        RNS.log("Error while executing proof request callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
-
-                    elif packet.context == RNS.Packet.LINKIDENTIFY:
-                        plaintext = self.decrypt(packet.data)
-                        if plaintext != None:
-                            if not self.initiator and len(plaintext) == RNS.Identity.KEYSIZE//8 + RNS.Identity.SIGLENGTH//8:
-                                public_key   = plaintext[:RNS.Identity.KEYSIZE//8]
-                                signed_data  = self.link_id+public_key
-                                signature    = plaintext[RNS.Identity.KEYSIZE//8:RNS.Identity.KEYSIZE//8+RNS.Identity.SIGLENGTH//8]
-                                identity     = RNS.Identity(create_keys=False)
-                                identity.load_public_key(public_key)
-
-                                if identity.validate(signature, signed_data):
-                                    self.__remote_identity = identity
-                                    if self.callbacks.remote_identified != None:
-                                        try:
-                                            self.callbacks.remote_identified(self, self.__remote_identity)
-                                        except Exception as e:
-                                            RNS.log("Error while executing remote identified callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
-                                
-                                    self.__update_phy_stats(packet, query_shared=True)
-
-                    elif packet.context == RNS.Packet.REQUEST:
-                        try:
-                            request_id = packet.getTruncatedHash()
-                            packed_request = self.decrypt(packet.data)
-                            if packed_request != None:
-                                unpacked_request = umsgpack.unpackb(packed_request)
-                                self.handle_request(request_id, unpacked_request)
-                                self.__update_phy_stats(packet, query_shared=True)
-                        except Exception as e:
-                            RNS.log("Error occurred while handling request. The contained exception was: "+str(e), RNS.LOG_ERROR)
-
-                    elif packet.context == RNS.Packet.RESPONSE:
-                        try:
-                            packed_response = self.decrypt(packet.data)
-                            if packed_response != None:
-                                unpacked_response = umsgpack.unpackb(packed_response)
-                                request_id = unpacked_response[0]
-                                response_data = unpacked_response[1]
-                                transfer_size = len(umsgpack.packb(response_data))-2
-                                self.handle_response(request_id, response_data, transfer_size, transfer_size)
-                                self.__update_phy_stats(packet, query_shared=True)
-                        except Exception as e:
-                            RNS.log("Error occurred while handling response. The contained exception was: "+str(e), RNS.LOG_ERROR)
-
-                    elif packet.context == RNS.Packet.LRRTT:
-                        if not self.initiator:
-                            self.rtt_packet(packet)
-                            self.__update_phy_stats(packet, query_shared=True)
-
-                    elif packet.context == RNS.Packet.LINKCLOSE:
-                        self.teardown_packet(packet)
-                        self.__update_phy_stats(packet, query_shared=True)
-
-                    elif packet.context == RNS.Packet.RESOURCE_ADV:
-                        packet.plaintext = self.decrypt(packet.data)
-                        if packet.plaintext != None:
-                            self.__update_phy_stats(packet, query_shared=True)
-
-                            if RNS.ResourceAdvertisement.is_request(packet):
-                                RNS.Resource.accept(packet, callback=self.request_resource_concluded)
-                            elif RNS.ResourceAdvertisement.is_response(packet):
-                                request_id = RNS.ResourceAdvertisement.read_request_id(packet)
-                                for pending_request in self.pending_requests:
-                                    if pending_request.request_id == request_id:
-                                        response_resource = RNS.Resource.accept(packet, callback=self.response_resource_concluded, progress_callback=pending_request.response_resource_progress, request_id = request_id)
-                                        if response_resource != None:
-                                            if pending_request.response_size == None:
-                                                pending_request.response_size = RNS.ResourceAdvertisement.read_size(packet)
-                                            if pending_request.response_transfer_size == None:
-                                                pending_request.response_transfer_size = 0
-                                            pending_request.response_transfer_size += RNS.ResourceAdvertisement.read_transfer_size(packet)
-                                            if pending_request.started_at == None:
-                                                pending_request.started_at = time.time()
-                                            pending_request.response_resource_progress(response_resource)
-
-                            elif self.resource_strategy == Link.ACCEPT_NONE:
-                                pass
-                            elif self.resource_strategy == Link.ACCEPT_APP:
-                                if self.callbacks.resource != None:
-                                    try:
-                                        resource_advertisement = RNS.ResourceAdvertisement.unpack(packet.plaintext)
-                                        resource_advertisement.link = self
-                                        if self.callbacks.resource(resource_advertisement):
-                                            RNS.Resource.accept(packet, self.callbacks.resource_concluded)
-                                        else:
-                                            RNS.Resource.reject(packet)
-                                    except Exception as e:
-                                        RNS.log("Error while executing resource accept callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
-                            elif self.resource_strategy == Link.ACCEPT_ALL:
-                                RNS.Resource.accept(packet, self.callbacks.resource_concluded)
-
-                    elif packet.context == RNS.Packet.RESOURCE_REQ:
-                        plaintext = self.decrypt(packet.data)
-                        if plaintext != None:
-                            self.__update_phy_stats(packet, query_shared=True)
-                            if ord(plaintext[:1]) == RNS.Resource.HASHMAP_IS_EXHAUSTED:
-                                resource_hash = plaintext[1+RNS.Resource.MAPHASH_LEN:RNS.Identity.HASHLENGTH//8+1+RNS.Resource.MAPHASH_LEN]
-                            else:
-                                resource_hash = plaintext[1:RNS.Identity.HASHLENGTH//8+1]
-
-                            for resource in self.outgoing_resources:
-                                if resource.hash == resource_hash:
-                                    # We need to check that this request has not been
-                                    # received before in order to avoid sequencing errors.
-                                    if not packet.packet_hash in resource.req_hashlist:
-                                        resource.req_hashlist.append(packet.packet_hash)
-                                        resource.request(plaintext)
-                                        
-                                        # TODO: Test and possibly enable this at some point
-                                        # def request_job():
-                                        #     resource.request(plaintext)
-                                        # threading.Thread(target=request_job, daemon=True).start()
-
-                    elif packet.context == RNS.Packet.RESOURCE_HMU:
-                        plaintext = self.decrypt(packet.data)
-                        if plaintext != None:
-                            self.__update_phy_stats(packet, query_shared=True)
-                            resource_hash = plaintext[:RNS.Identity.HASHLENGTH//8]
-                            for resource in self.incoming_resources:
-                                if resource_hash == resource.hash:
-                                    resource.hashmap_update_packet(plaintext)
-
-                    elif packet.context == RNS.Packet.RESOURCE_ICL:
-                        plaintext = self.decrypt(packet.data)
-                        if plaintext != None:
-                            self.__update_phy_stats(packet)
-                            resource_hash = plaintext[:RNS.Identity.HASHLENGTH//8]
-                            for resource in self.incoming_resources:
-                                if resource_hash == resource.hash:
-                                    resource.cancel()
-
-                    elif packet.context == RNS.Packet.RESOURCE_RCL:
-                        plaintext = self.decrypt(packet.data)
-                        if plaintext != None:
-                            self.__update_phy_stats(packet)
-                            resource_hash = plaintext[:RNS.Identity.HASHLENGTH//8]
-                            for resource in self.outgoing_resources:
-                                if resource_hash == resource.hash:
-                                    resource._rejected()
-
-                    elif packet.context == RNS.Packet.KEEPALIVE:
-                        if not self.initiator and packet.data == bytes([0xFF]):
-                            keepalive_packet = RNS.Packet(self, bytes([0xFE]), context=RNS.Packet.KEEPALIVE)
-                            keepalive_packet.send()
-                            self.had_outbound(is_keepalive = True)
-
-
-                    # TODO: find the most efficient way to allow multiple
-                    # transfers at the same time, sending resource hash on
-                    # each packet is a huge overhead. Probably some kind
-                    # of hash -> sequence map
-                    elif packet.context == RNS.Packet.RESOURCE:
-                        for resource in self.incoming_resources:
-                            resource.receive_part(packet)
-                            self.__update_phy_stats(packet)
-
-                    elif packet.context == RNS.Packet.CHANNEL:
-                        if not self._channel:
-                            RNS.log(f"Channel data received without open channel", RNS.LOG_DEBUG)
-                        else:
-                            packet.prove()
-                            plaintext = self.decrypt(packet.data)
-                            if plaintext != None:
-                                self.__update_phy_stats(packet)
-                                self._channel._receive(plaintext)
-
-                elif packet.packet_type == RNS.Packet.PROOF:
-                    if packet.context == RNS.Packet.RESOURCE_PRF:
-                        resource_hash = packet.data[0:RNS.Identity.HASHLENGTH//8]
-                        for resource in self.outgoing_resources:
-                            if resource_hash == resource.hash:
-                                resource.validate_proof(packet.data)
-                                self.__update_phy_stats(packet, query_shared=True)
+                if packet.packet_type == Link._PT_DATA:
+                    handler = Link._DATA_HANDLERS.get(packet.context)
+                    if handler != None:
+                        handler(self, packet)
 
-        self.watchdog_lock = False
+                elif packet.packet_type == Link._PT_PROOF:
+                    handler = Link._PROOF_HANDLERS.get(packet.context)
+                    if handler != None:
+                        handler(self, packet)
 
 
     def encrypt(self, plaintext):
         try:
-            if not self.token:
-                try: self.token = Token(self.derived_key)
-                except Exception as e:
-                    RNS.log("Could not instantiate token while performing encryption on link "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
-                    raise e
-
             return self.token.encrypt(plaintext)
 
         except Exception as e:
@@ -1205,7 +1476,6 @@ class Link:
 
     def decrypt(self, ciphertext):
         try:
-            if not self.token: self.token = Token(self.derived_key)
             return self.token.decrypt(ciphertext)
 
         except Exception as e:
@@ -1283,15 +1553,21 @@ class Link:
         self.callbacks.remote_identified = callback
 
     def resource_concluded(self, resource):
-        concluded_at = time.time()
-        if resource in self.incoming_resources:
+        concluded_at = _time()
+        if self._incoming_by_id.pop(id(resource), None) != None:
             self.last_resource_window = resource.window
             self.last_resource_eifr = resource.eifr
-            self.incoming_resources.remove(resource)
-            self.expected_rate = (resource.size*8)/(max(concluded_at-resource.started_transferring, 0.0001))
-        if resource in self.outgoing_resources:
-            self.outgoing_resources.remove(resource)
-            self.expected_rate = (resource.size*8)/(max(concluded_at-resource.started_transferring, 0.0001))
+            if self._incoming_by_hash.get(resource.hash) is resource:
+                self._incoming_by_hash.pop(resource.hash)
+            dt = concluded_at-resource.started_transferring
+            if dt < 0.0001: dt = 0.0001
+            self.expected_rate = (resource.size*8)/dt
+        if self._outgoing_by_id.pop(id(resource), None) != None:
+            if self._outgoing_by_hash.get(resource.hash) is resource:
+                self._outgoing_by_hash.pop(resource.hash)
+            dt = concluded_at-resource.started_transferring
+            if dt < 0.0001: dt = 0.0001
+            self.expected_rate = (resource.size*8)/dt
 
     def set_resource_strategy(self, resource_strategy):
         """
@@ -1306,17 +1582,31 @@ class Link:
             self.resource_strategy = resource_strategy
 
     def register_outgoing_resource(self, resource):
-        self.outgoing_resources.append(resource)
+        key = id(resource)
+        if key in self._outgoing_by_id: return
+        self._outgoing_by_id[key] = resource
+        self._outgoing_by_hash[resource.hash] = resource
 
     def register_incoming_resource(self, resource):
-        self.incoming_resources.append(resource)
+        key = id(resource)
+        if key in self._incoming_by_id: return
+        self._incoming_by_id[key] = resource
+        self._incoming_by_hash[resource.hash] = resource
 
     def has_incoming_resource(self, resource):
-        for incoming_resource in self.incoming_resources:
-            if incoming_resource.hash == resource.hash:
-                return True
+        return resource.hash in self._incoming_by_hash
+
+    @property
+    def incoming_resources(self):
+        return list(self._incoming_by_id.values())
+
+    @property
+    def outgoing_resources(self):
+        return list(self._outgoing_by_id.values())
 
-        return False
+    @property
+    def pending_requests(self):
+        return list(self._pending_by_id.values())
 
     def get_last_resource_window(self):
         return self.last_resource_window
@@ -1325,25 +1615,36 @@ class Link:
         return self.last_resource_eifr
 
     def cancel_outgoing_resource(self, resource):
-        if resource in self.outgoing_resources:
-            self.outgoing_resources.remove(resource)
+        if self._outgoing_by_id.pop(id(resource), None) != None:
+            if self._outgoing_by_hash.get(resource.hash) is resource:
+                self._outgoing_by_hash.pop(resource.hash)
         else:
             RNS.log("Attempt to cancel a non-existing outgoing resource", RNS.LOG_ERROR)
 
+    def _drain_resources(self):
+        # Cancels and unindexes every in-flight resource in one sweep,
+        # so link teardown stays linear in the number of transfers.
+        for resource in list(self._incoming_by_id.values()):
+            resource.cancel()
+        for resource in list(self._outgoing_by_id.values()):
+            resource.cancel()
+        self._incoming_by_id.clear()
+        self._outgoing_by_id.clear()
+        self._incoming_by_hash.clear()
+        self._outgoing_by_hash.clear()
+
     def cancel_incoming_resource(self, resource):
-        if resource in self.incoming_resources:
-            self.incoming_resources.remove(resource)
+        if self._incoming_by_id.pop(id(resource), None) != None:
+            if self._incoming_by_hash.get(resource.hash) is resource:
+                self._incoming_by_hash.pop(resource.hash)
         else:
             RNS.log("Attempt to cancel a non-existing incoming resource", RNS.LOG_ERROR)
 
     def ready_for_new_resource(self):
-        if len(self.outgoing_resources) > 0:
-            return False
-        else:
-            return True
+        return not self._outgoing_by_id
 
     def __str__(self):
-        return RNS.prettyhexrep(self.link_id)
+        return _pretty(self.link_id)
 
 
 class RequestReceipt():
@@ -1359,15 +1660,27 @@ class RequestReceipt():
     RECEIVING = 0x03
     READY     = 0x04
 
+    _TERMINAL_STATUSES = frozenset([FAILED, READY])
+
+    __slots__ = (
+        "packet_receipt", "resource", "started_at", "hash", "link",
+        "request_id", "request_size", "response", "response_transfer_size",
+        "response_size", "metadata", "status", "sent_at", "progress",
+        "concluded_at", "response_concluded_at", "timeout", "cb_response",
+        "cb_failed", "cb_progress", "__resource_response_timeout",
+        "__timeout_entry")
+
     def __init__(self, link, packet_receipt = None, resource = None, response_callback = None, failed_callback = None, progress_callback = None, timeout = None, request_size = None):
+        now = _monotonic()
         self.packet_receipt = packet_receipt
         self.resource = resource
         self.started_at = None
+        self.__timeout_entry = None
 
         if self.packet_receipt != None:
             self.hash = packet_receipt.truncated_hash
             self.packet_receipt.set_timeout_callback(self.request_timed_out)
-            self.started_at = time.time()
+            self.started_at = now
 
         elif self.resource != None:
             self.hash = resource.request_id
@@ -1382,7 +1695,7 @@ class RequestReceipt():
         self.response_size          = None
         self.metadata               = None
         self.status                 = RequestReceipt.SENT
-        self.sent_at                = time.time()
+        self.sent_at                = now
         self.progress               = 0
         self.concluded_at           = None
         self.response_concluded_at  = None
@@ -1392,77 +1705,82 @@ class RequestReceipt():
         else:
             raise ValueError("No timeout specified for request receipt")
 
-        self.callbacks          = RequestReceiptCallbacks()
-        self.callbacks.response = response_callback
-        self.callbacks.failed   = failed_callback
-        self.callbacks.progress = progress_callback
+        self.cb_response        = response_callback
+        self.cb_failed          = failed_callback
+        self.cb_progress        = progress_callback
+
+        self.link._pending_by_id[self.request_id] = self
 
-        self.link.pending_requests.append(self)
+
+    def _safe_call(self, callback, label):
+        if callback != None:
+            try:
+                callback(self)
+            except Exception as e:
+                _log("Error while executing "+label+" from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
 
 
     def request_resource_concluded(self, resource):
         if resource.status == RNS.Resource.COMPLETE:
-            RNS.log("Request "+RNS.prettyhexrep(self.request_id)+" successfully sent as resource.", RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                _log("Request "+_pretty(self.request_id)+" successfully sent as resource.", RNS.LOG_DEBUG)
+            now = _monotonic()
             if self.started_at == None:
-                self.started_at = time.time()
+                self.started_at = now
             self.status = RequestReceipt.DELIVERED
-            self.__resource_response_timeout = time.time()+self.timeout
-            response_timeout_thread = threading.Thread(target=self.__response_timeout_job)
-            response_timeout_thread.daemon = True
-            response_timeout_thread.start()
+            self.__resource_response_timeout = now+self.timeout
+            self.__timeout_entry = WatchdogService.instance().schedule(self.__response_timeout_job, self.timeout)
         else:
-            RNS.log("Sending request "+RNS.prettyhexrep(self.request_id)+" as resource failed with status: "+RNS.hexrep([resource.status]), RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                _log("Sending request "+_pretty(self.request_id)+" as resource failed with status: "+RNS.hexrep([resource.status]), RNS.LOG_DEBUG)
             self.status = RequestReceipt.FAILED
-            self.concluded_at = time.time()
-            self.link.pending_requests.remove(self)
-
-            if self.callbacks.failed != None:
-                try:
-                    self.callbacks.failed(self)
-                except Exception as e:
-                    RNS.log("Error while executing request failed callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+            self.concluded_at = _monotonic()
+            self.link._pending_by_id.pop(self.request_id, None)
+            self._safe_call(self.cb_failed, "request failed callback")
 
 
     def __response_timeout_job(self):
-        while self.status == RequestReceipt.DELIVERED:
-            now = time.time()
-            if now > self.__resource_response_timeout:
-                self.request_timed_out(None)
+        if self.status != RequestReceipt.DELIVERED:
+            return None
 
-            time.sleep(0.1)
+        remaining = self.__resource_response_timeout - _monotonic()
+        if remaining > 0:
+            return remaining
 
+        self.request_timed_out(None)
+        return None
 
-    def request_timed_out(self, packet_receipt):
-        self.status = RequestReceipt.FAILED
-        self.concluded_at = time.time()
-        self.link.pending_requests.remove(self)
 
-        if self.callbacks.failed != None:
-            try:
-                self.callbacks.failed(self)
-            except Exception as e:
-                RNS.log("Error while executing request timed out callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+    def _cancel_response_timeout(self):
+        if self.__timeout_entry != None:
+            WatchdogService.instance().cancel(self.__timeout_entry)
+            self.__timeout_entry = None
 
+    def request_timed_out(self, packet_receipt):
+        self.status = RequestReceipt.FAILED
+        self.concluded_at = _monotonic()
+        self._cancel_response_timeout()
+        self.link._pending_by_id.pop(self.request_id, None)
+        self._safe_call(self.cb_failed, "request timed out callback")
+
+
+    def _mark_packet_delivered(self):
+        pr = self.packet_receipt
+        if pr is not None and pr.status != RNS.PacketReceipt.DELIVERED:
+            pr.status = RNS.PacketReceipt.DELIVERED
+            pr.proved = True
+            pr.concluded_at = _time()
+            cb = pr.callbacks.delivery
+            if cb is not None:
+                cb(pr)
 
     def response_resource_progress(self, resource):
         if resource != None:
             if not self.status == RequestReceipt.FAILED:
                 self.status = RequestReceipt.RECEIVING
-                if self.packet_receipt != None:
-                    if self.packet_receipt.status != RNS.PacketReceipt.DELIVERED:
-                        self.packet_receipt.status = RNS.PacketReceipt.DELIVERED
-                        self.packet_receipt.proved = True
-                        self.packet_receipt.concluded_at = time.time()
-                        if self.packet_receipt.callbacks.delivery != None:
-                            self.packet_receipt.callbacks.delivery(self.packet_receipt)
-
+                self._mark_packet_delivered()
                 self.progress = resource.get_progress()
-                
-                if self.callbacks.progress != None:
-                    try:
-                        self.callbacks.progress(self)
-                    except Exception as e:
-                        RNS.log("Error while executing response progress callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+                self._safe_call(self.cb_progress, "response progress callback")
             else:
                 resource.cancel()
 
@@ -1473,26 +1791,13 @@ class RequestReceipt():
             self.response = response
             self.metadata = metadata
             self.status = RequestReceipt.READY
-            self.response_concluded_at = time.time()
-
-            if self.packet_receipt != None:
-                self.packet_receipt.status = RNS.PacketReceipt.DELIVERED
-                self.packet_receipt.proved = True
-                self.packet_receipt.concluded_at = time.time()
-                if self.packet_receipt.callbacks.delivery != None:
-                    self.packet_receipt.callbacks.delivery(self.packet_receipt)
+            self.response_concluded_at = _monotonic()
+            self._cancel_response_timeout()
 
-            if self.callbacks.progress != None:
-                try:
-                    self.callbacks.progress(self)
-                except Exception as e:
-                    RNS.log("Error while executing response progress callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+            self._mark_packet_delivered()
 
-            if self.callbacks.response != None:
-                try:
-                    self.callbacks.response(self)
-                except Exception as e:
-                    RNS.log("Error while executing response received callback from "+str(self)+". The contained exception was: "+str(e), RNS.LOG_ERROR)
+            self._safe_call(self.cb_progress, "response progress callback")
+            self._safe_call(self.cb_response, "response received callback")
 
     def get_request_id(self):
         """
@@ -1534,17 +1839,6 @@ class RequestReceipt():
         """
         :returns: True if the associated request has concluded (successfully or with a failure), otherwise False.
         """
-        if self.status == RequestReceipt.READY:
-            return True
-        elif self.status == RequestReceipt.FAILED:
-            return True
-        else:
-            return False
+        return self.status in RequestReceipt._TERMINAL_STATUSES
 
 
-
-class RequestReceiptCallbacks:
-    def __init__(self):
-        self.response = None
-        self.failed   = None
-        self.progress = None
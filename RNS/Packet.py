@@ -117,7 +117,7 @@ class Packet:
     __slots__  = "hops", "header", "header_type", "packet_type", "transport_type", "context", "context_flag", "destination"
     __slots__ += "transport_id", "data", "flags", "raw", "packed", "sent", "create_receipt", "receipt", "fromPacked", "MTU"
     __slots__ += "sent_at", "packet_hash", "ratchet_id", "attached_interface", "receiving_interface", "rssi", "snr", "q"
-    __slots__ += "ciphertext", "plaintext", "destination_hash", "destination_type", "link", "map_hash"
+    __slots__ += "ciphertext", "plaintext", "destination_hash", "destination_type", "link", "map_hash", "_resource_adv"
 
     def __init__(self, destination, data, packet_type = DATA, context = NONE, transport_type = RNS.Transport.BROADCAST,
                  header_type = HEADER_1, transport_id = None, attached_interface = None, create_receipt = True, context_flag=FLAG_UNSET):
@@ -277,7 +277,10 @@ class Packet:
         :returns: A :ref:`RNS.PacketReceipt<api-packetreceipt>` instance if *create_receipt* was set to *True* when the packet was instantiated, if not returns *None*. If the packet could not be sent *False* is returned.
         """
         if not self.sent:
-            if self.destination.type == RNS.Destination.LINK:
+            # Only actual Link instances get their outbound timer touched
+            # here; the timestamp is in the monotonic domain used by the
+            # link timers, which plain destinations must not inherit.
+            if isinstance(self.destination, RNS.Link):
                 if self.destination.status == RNS.Link.CLOSED:
                     RNS.log("Attempt to transmit over a closed link, dropping packet", RNS.LOG_DEBUG)
                     self.sent = False
@@ -285,7 +288,7 @@ class Packet:
                     return False
 
                 else:
-                    self.destination.last_outbound = time.time()
+                    self.destination.last_outbound = time.monotonic()
                     self.destination.tx += 1
                     self.destination.txbytes += len(self.data)
 
@@ -464,7 +467,7 @@ class PacketReceipt:
                     self.proved = True
                     self.concluded_at = time.time()
                     self.proof_packet = proof_packet
-                    link.last_proof = self.concluded_at
+                    link.last_proof = time.monotonic()
 
                     if self.callbacks.delivery != None:
                         try:
@@ -153,7 +153,7 @@ class Resource:
     @staticmethod
     def reject(advertisement_packet):
         try:
-            adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+            adv = ResourceAdvertisement.from_packet(advertisement_packet)
             resource_hash = adv.h
             reject_packet = RNS.Packet(advertisement_packet.link, resource_hash, context=RNS.Packet.RESOURCE_RCL)
             reject_packet.send()
@@ -165,7 +165,7 @@ class Resource:
     @staticmethod
     def accept(advertisement_packet, callback=None, progress_callback = None, request_id = None):
         try:
-            adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+            adv = ResourceAdvertisement.from_packet(advertisement_packet)
 
             resource = Resource(None, advertisement_packet.link, request_id = request_id)
             resource.status = Resource.TRANSFERRING
@@ -1218,9 +1218,21 @@ class ResourceAdvertisement:
 
     assert HASHMAP_MAX_LEN > 0, "The configured MTU is too small to include any map hashes in resource advertisments"
 
+    @staticmethod
+    def from_packet(advertisement_packet):
+        # Advertisements are queried several times while a packet moves
+        # through reception, so the unpacked advertisement is parsed
+        # once and cached on the packet itself.
+        adv = getattr(advertisement_packet, "_resource_adv", None)
+        if adv == None:
+            adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+            advertisement_packet._resource_adv = adv
+        return adv
+
+
     @staticmethod
     def is_request(advertisement_packet):
-        adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+        adv = ResourceAdvertisement.from_packet(advertisement_packet)
         if adv.q != None and adv.u:
             return True
         else:
@@ -1229,7 +1241,7 @@ class ResourceAdvertisement:
 
     @staticmethod
     def is_response(advertisement_packet):
-        adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+        adv = ResourceAdvertisement.from_packet(advertisement_packet)
 
         if adv.q != None and adv.p:
             return True
@@ -1239,19 +1251,19 @@ class ResourceAdvertisement:
 
     @staticmethod
     def read_request_id(advertisement_packet):
-        adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+        adv = ResourceAdvertisement.from_packet(advertisement_packet)
         return adv.q
 
 
     @staticmethod
     def read_transfer_size(advertisement_packet):
-        adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+        adv = ResourceAdvertisement.from_packet(advertisement_packet)
         return adv.t
 
 
     @staticmethod
     def read_size(advertisement_packet):
-        adv = ResourceAdvertisement.unpack(advertisement_packet.plaintext)
+        adv = ResourceAdvertisement.from_packet(advertisement_packet)
         return adv.d
 
 
@@ -522,6 +522,48 @@ class TestLink(unittest.TestCase):
     def lr_callback(self, resource):
         TestLink.large_resource_status = resource.status
 
+    @skipIf(os.getenv('SKIP_NORMAL_TESTS') != None, "Skipping")
+    def test_08_request(self):
+        init_rns(self)
+        print("")
+        print("Request round-trip test")
+
+        # TODO: Load this from public bytes only
+        id1 = RNS.Identity.from_bytes(bytes.fromhex(fixed_keys[0][0]))
+        self.assertEqual(id1.hash, bytes.fromhex(fixed_keys[0][1]))
+
+        RNS.Transport.request_path(bytes.fromhex("fb48da0e82e6e01ba0c014513f74540d"))
+        time.sleep(0.2)
+
+        dest = RNS.Destination(id1, RNS.Destination.OUT, RNS.Destination.SINGLE, APP_NAME, "link", "establish")
+        self.assertEqual(dest.hash, bytes.fromhex("fb48da0e82e6e01ba0c014513f74540d"))
+
+        l1 = RNS.Link(dest)
+        time.sleep(LINK_UP_WAIT)
+        self.assertEqual(l1.status, RNS.Link.ACTIVE)
+
+        request_data = os.urandom(256)
+        request_receipt = l1.request("/echo", data=request_data, timeout=10)
+        self.assertNotEqual(request_receipt, False)
+
+        timeout = time.time() + 10
+        while not request_receipt.concluded():
+            time.sleep(0.01)
+            self.assertTrue(time.time() < timeout)
+
+        self.assertEqual(request_receipt.status, RNS.RequestReceipt.READY)
+        self.assertEqual(request_receipt.get_response(), request_data)
+
+        # The receipt timestamps must share a clock domain, so the
+        # response time has to be a sane, non-negative duration
+        response_time = request_receipt.get_response_time()
+        self.assertNotEqual(response_time, None)
+        self.assertTrue(0 <= response_time < 10)
+
+        l1.teardown()
+        time.sleep(LINK_UP_WAIT)
+        self.assertEqual(l1.status, RNS.Link.CLOSED)
+
     @skipIf(os.getenv('SKIP_NORMAL_TESTS') != None, "Skipping")
     def test_09_large_resource(self):
         if RNS.Cryptography.backend() == "internal":
@@ -885,11 +927,15 @@ def targets(yp=False):
 
         buffer = RNS.Buffer.create_bidirectional_buffer(0, 0, channel, handle_buffer)
 
+    def request_echo(path, data, request_id, link_id, remote_identity, requested_at):
+        return data
+
     m_rns = RNS.Reticulum("./tests/rnsconfig", logdest=RNS.LOG_FILE, loglevel=RNS.LOG_EXTREME)
     id1 = RNS.Identity.from_bytes(bytes.fromhex(fixed_keys[0][0]))
     d1 = RNS.Destination(id1, RNS.Destination.IN, RNS.Destination.SINGLE, APP_NAME, "link", "establish")
     d1.set_proof_strategy(RNS.Destination.PROVE_ALL)
     d1.set_link_established_callback(link_established)
+    d1.register_request_handler("/echo", response_generator=request_echo, allow=RNS.Destination.ALLOW_ALL)
 
     while True:
         time.sleep(1)